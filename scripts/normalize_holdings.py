@@ -3,19 +3,24 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-# Add project root to sys.path so 'src' can be imported when running directly
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# Add project root to sys.path so 'src' can be imported when running directly;
+# under `python -m scripts.<name>` it is already importable.
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import argparse
 import csv
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from src.config import load_account_brokers
+from src.ingestion.files import list_files
 from src.ingestion.ii import parse_ii_holdings
 from src.ingestion.hsbc import parse_hsbc_holdings
-from src.normalization.holdings import HoldingRecord
+from src.normalization.holdings import HOLDING_FIELDS, HoldingRecord
+from src.normalization.ids import dedupe_key
 
 
 DATE_PATTERNS = (
@@ -26,14 +31,22 @@ DATE_PATTERNS = (
 
 
 def _find_holding_files(root: Path) -> List[Path]:
-    patterns = ["holdings_*_*.csv", "holdings_*_*.txt"]
-    files = []
-    for pattern in patterns:
-        files.extend(root.glob(pattern)) 
-    return sorted(files)
+    return list_files(root, ["holdings_*_*.csv", "holdings_*_*.txt"])
 
 
 def _extract_date_from_stem(stem: str) -> Tuple[datetime.date, str]:
+    # Most filenames carry the ISO date as its own underscore-delimited token.
+    # A match cannot span "_", so the first token containing an ISO date holds
+    # the leftmost match; when that token is exactly the date, return it
+    # without searching the whole stem, otherwise use the regex table as is.
+    iso_pattern, iso_format = DATE_PATTERNS[0]
+    for token in stem.split("_"):
+        match = iso_pattern.search(token)
+        if match is None:
+            continue
+        if match.group(0) == token:
+            return datetime.strptime(token, iso_format).date(), token
+        break
     for pattern, date_format in DATE_PATTERNS:
         match = pattern.search(stem)
         if match:
@@ -80,37 +93,64 @@ def _parse_holdings(
     raise ValueError(f"Unsupported broker: {broker}")
 
 
+def _parse_holding_file(
+    path: Path,
+    broker: str,
+    account_name: str,
+    valuation_date: datetime.date,
+) -> List[HoldingRecord]:
+    # Runs in a worker process, so return a picklable list rather than a generator.
+    return list(
+        _parse_holdings(
+            path,
+            broker=broker,
+            account_name=account_name,
+            valuation_date=valuation_date,
+        )
+    )
+
+
 def _write_holdings(records: Iterable[HoldingRecord], output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    records_list = list(records)
+    records_list = sorted(records, key=lambda r: (r.symbol or "", r.name or ""))
     if not records_list:
         return
-    records_list.sort(key=lambda r: (r.symbol or "", r.name or ""))
     with output_path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=list(records_list[0].to_dict().keys()))
-        writer.writeheader()
-        for record in records_list:
-            writer.writerow(record.to_dict())
+        writer = csv.writer(handle)
+        writer.writerow(HOLDING_FIELDS)
+        writer.writerows(record.to_row() for record in records_list)
 
 
-def normalize_holdings(raw_root: Path, output_root: Path, config_path: Path) -> None:
+def normalize_holdings(
+    raw_root: Path,
+    output_root: Path,
+    config_path: Path,
+    max_workers: Optional[int] = None,
+) -> None:
     account_brokers = load_account_brokers(config_path)
-    seen_ids = set()
+    seen_ids: set[int] = set()
     grouped: Dict[Tuple[str, datetime.date], List[HoldingRecord]] = {}
 
-    for path in _find_holding_files(raw_root):
+    paths = _find_holding_files(raw_root)
+    account_names: List[str] = []
+    valuation_dates: List[datetime.date] = []
+    for path in paths:
         account_name, valuation_date = _extract_account_name(path)
-        broker = _broker_for_account(account_name, account_brokers)
-        for record in _parse_holdings(
-            path,
-            broker=broker,
-            account_name=account_name,
-            valuation_date=valuation_date,
-        ):
-            if record.snapshot_id in seen_ids:
-                continue
-            seen_ids.add(record.snapshot_id)
-            grouped.setdefault((account_name, valuation_date), []).append(record)
+        account_names.append(account_name)
+        valuation_dates.append(valuation_date)
+    brokers = [_broker_for_account(account_name, account_brokers) for account_name in account_names]
+
+    # Files are parsed in parallel, but results come back in file order so
+    # the first occurrence of a duplicate holding still wins.
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        parsed_files = executor.map(_parse_holding_file, paths, brokers, account_names, valuation_dates)
+        for account_name, valuation_date, records in zip(account_names, valuation_dates, parsed_files):
+            for record in records:
+                key = dedupe_key(record.snapshot_id)
+                if key in seen_ids:
+                    continue
+                seen_ids.add(key)
+                grouped.setdefault((account_name, valuation_date), []).append(record)
 
     for (account_name, valuation_date), records in grouped.items():
         output_path = (
@@ -121,6 +161,13 @@ def normalize_holdings(raw_root: Path, output_root: Path, config_path: Path) ->
         _write_holdings(records, output_path)
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Normalize broker holdings snapshot files.")
     parser.add_argument(
@@ -144,8 +191,15 @@ def main() -> None:
         default=Path("src/config/accounts.json"),
         help="Path to account-to-broker config JSON.",
     )
+    parser.add_argument(
+        "--workers",
+        dest="max_workers",
+        type=_positive_int,
+        default=None,
+        help="Number of worker processes used to parse input files (defaults to the CPU count).",
+    )
     args = parser.parse_args()
-    normalize_holdings(args.input_root, args.output_root, args.config_path)
+    normalize_holdings(args.input_root, args.output_root, args.config_path, args.max_workers)
 
 
 if __name__ == "__main__":
@@ -3,26 +3,28 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-# Add project root to sys.path so 'src' can be imported when running directly
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# Add project root to sys.path so 'src' can be imported when running directly;
+# under `python -m scripts.<name>` it is already importable.
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import argparse
 import csv
-from pathlib import Path
-from typing import Dict, Iterable, List
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
 
 from src.config import load_account_brokers
+from src.ingestion.files import list_files
 from src.ingestion.ii import parse_ii_transactions
 from src.ingestion.hsbc import parse_hsbc_transactions
-from src.normalization.transactions import TransactionRecord
+from src.normalization.ids import dedupe_key
+from src.normalization.transactions import TRANSACTION_FIELDS, TransactionRecord
 
 
 def _find_transaction_files(root: Path) -> List[Path]:
-    patterns = ["transactions_*_*.csv", "transactions_*_*.txt"]
-    files = []
-    for pattern in patterns:
-        files.extend(root.glob(pattern)) 
-    return sorted(files)
+    return list_files(root, ["transactions_*_*.csv", "transactions_*_*.txt"])
 
 
 def _extract_account_name(path: Path) -> str:
@@ -45,38 +47,92 @@ def _parse_transactions(path: Path, broker: str, account_name: str) -> Iterable[
     raise ValueError(f"Unsupported broker: {broker}")
 
 
+def _parse_transaction_file(path: Path, broker: str, account_name: str) -> List[TransactionRecord]:
+    # Runs in a worker process, so return a picklable list rather than a generator.
+    return list(_parse_transactions(path, broker=broker, account_name=account_name))
+
+
 def _write_transactions(records: Iterable[TransactionRecord], output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    records_list = list(records)
-    if not records_list:
+    records_iter = iter(records)
+    first = next(records_iter, None)
+    if first is None:
         return
     with output_path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=list(records_list[0].to_dict().keys()))
-        writer.writeheader()
-        for record in records_list:
-            writer.writerow(record.to_dict())
+        writer = csv.writer(handle)
+        writer.writerow(TRANSACTION_FIELDS)
+        writer.writerow(first.to_row())
+        writer.writerows(record.to_row() for record in records_iter)
+
+
+def _write_account_transactions(records: List[TransactionRecord], account_root: Path) -> None:
+    if not records:
+        return
+    records.sort(key=lambda r: r.trade_date)
+    _write_transactions(records, account_root / "transactions_normalized.csv")
 
 
-def normalize_transactions(raw_root: Path, output_root: Path, config_path: Path) -> None:
+def normalize_transactions(
+    raw_root: Path,
+    output_root: Path,
+    config_path: Path,
+    max_workers: Optional[int] = None,
+) -> None:
     account_brokers = load_account_brokers(config_path)
-    seen_ids = set()
-    grouped: Dict[str, List[TransactionRecord]] = {}
 
+    paths_by_account: Dict[str, List[Path]] = {}
     for path in _find_transaction_files(raw_root):
-        account_name = _extract_account_name(path)
-        broker = _broker_for_account(account_name, account_brokers)
-        for record in _parse_transactions(path, broker=broker, account_name=account_name):
-            if record.transaction_id in seen_ids:
-                continue
-            seen_ids.add(record.transaction_id)
-            grouped.setdefault(account_name, []).append(record)
-    
-    for account_name in grouped:
-        grouped[account_name].sort(key=lambda r: r.trade_date)
-
-    for account_name, records in grouped.items():
-        output_path = output_root / account_name / "transactions_normalized.csv"
-        _write_transactions(records, output_path)
+        paths_by_account.setdefault(_extract_account_name(path), []).append(path)
+
+    tasks = [
+        (account_name, path, _broker_for_account(account_name, account_brokers))
+        for account_name, paths in paths_by_account.items()
+        for path in paths
+    ]
+    # At most one file per worker is in flight, so besides the account being
+    # written only a bounded window of parsed files is held in memory. Files
+    # are submitted and consumed in account order, then file order, so the
+    # first occurrence of a duplicate transaction still wins. Transaction ids
+    # include the account name, so duplicates never span accounts and the
+    # dedupe set can be dropped after each one.
+    window = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=window) as executor:
+        remaining = iter(tasks)
+        in_flight: Deque[Tuple[str, Future[List[TransactionRecord]]]] = deque()
+        current_account: Optional[str] = None
+        seen_ids: set[int] = set()
+        records: List[TransactionRecord] = []
+        while True:
+            while len(in_flight) < window:
+                task = next(remaining, None)
+                if task is None:
+                    break
+                account_name, path, broker = task
+                in_flight.append((account_name, executor.submit(_parse_transaction_file, path, broker, account_name)))
+            if not in_flight:
+                break
+            account_name, future = in_flight.popleft()
+            if account_name != current_account:
+                if current_account is not None:
+                    _write_account_transactions(records, output_root / current_account)
+                current_account = account_name
+                seen_ids = set()
+                records = []
+            for record in future.result():
+                key = dedupe_key(record.transaction_id)
+                if key in seen_ids:
+                    continue
+                seen_ids.add(key)
+                records.append(record)
+        if current_account is not None:
+            _write_account_transactions(records, output_root / current_account)
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
 
 
 def main() -> None:
@@ -102,8 +158,15 @@ def main() -> None:
         default=Path("src/config/accounts.json"),
         help="Path to account-to-broker config JSON.",
     )
+    parser.add_argument(
+        "--workers",
+        dest="max_workers",
+        type=_positive_int,
+        default=None,
+        help="Number of worker processes used to parse input files (defaults to the CPU count).",
+    )
     args = parser.parse_args()
-    normalize_transactions(args.input_root, args.output_root, args.config_path)
+    normalize_transactions(args.input_root, args.output_root, args.config_path, args.max_workers)
 
 
 if __name__ == "__main__":
@@ -4,12 +4,15 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
-# Add project root to sys.path so 'src' can be imported when running directly
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# Add project root to sys.path so 'src' can be imported when running directly;
+# under `python -m scripts.<name>` it is already importable.
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import argparse
 from datetime import date
 
+from src.ingestion.files import find_files
 from src.positions.reconcile import reconcile_positions
 
 
@@ -24,13 +27,9 @@ def _extract_valuation_date(path: Path) -> date:
     raise ValueError(f"Unable to find valuation date in {path.name}")
 
 
-def _find_holdings_files(root: Path) -> list[Path]:
-    return sorted(root.glob("**/holdings_*_normalized.csv"))
-
-
 def reconcile_root(normalized_root: Path) -> list[str]:
     mismatches: list[str] = []
-    for holdings_path in _find_holdings_files(normalized_root):
+    for holdings_path in find_files(normalized_root, "holdings_*_normalized.csv"):
         transactions_path = holdings_path.parent / "transactions_normalized.csv"
         if not transactions_path.exists():
             mismatches.append(
@@ -5,12 +5,21 @@ import argparse
 import sys
 from pathlib import Path
 
-# Add project root to sys.path so 'src' can be imported when running directly
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# Add project root to sys.path so 'src' can be imported when running directly;
+# under `python -m scripts.<name>` it is already importable.
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from src.reporting.income_report  import summarize_income, write_income_report
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description=(
@@ -41,9 +50,16 @@ def main() -> None:
         required=True,
         help="Path to write the aggregated income report CSV.",
     )
+    parser.add_argument(
+        "--workers",
+        dest="max_workers",
+        type=_positive_int,
+        default=None,
+        help="Number of worker processes used to summarize transaction files (defaults to the CPU count).",
+    )
     args = parser.parse_args()
 
-    summary = summarize_income(args.transactions_root, accounts=args.accounts)
+    summary = summarize_income(args.transactions_root, accounts=args.accounts, max_workers=args.max_workers)
     write_income_report(summary, args.output_path)
 
 
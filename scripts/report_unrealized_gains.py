@@ -5,8 +5,10 @@ import argparse
 import sys
 from pathlib import Path
 
-# Add project root to sys.path so 'src' can be imported when running directly
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# Add project root to sys.path so 'src' can be imported when running directly;
+# under `python -m scripts.<name>` it is already importable.
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from src.reporting.unrealized_gain_report import (
     summarize_unrealized_gains,
@@ -15,6 +17,13 @@ from src.reporting.unrealized_gain_report import (
 )
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description=(
@@ -70,12 +79,20 @@ def main() -> None:
             "By default, only the latest holdings per account are included."
         ),
     )
+    parser.add_argument(
+        "--workers",
+        dest="max_workers",
+        type=_positive_int,
+        default=None,
+        help="Number of worker processes used to price accounts (defaults to the CPU count).",
+    )
     args = parser.parse_args()
 
     rows = summarize_unrealized_gains(
         args.transactions_root,
         args.holdings_root,
         accounts=args.accounts,
+        max_workers=args.max_workers,
     )
     write_unrealized_gain_reports(rows, args.output_root)
     if args.combined_output:
@@ -2,18 +2,26 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 
-def load_account_brokers(config_path: Path) -> Dict[str, str]:
-    """Load account-to-broker mappings from a JSON configuration file."""
-    data = json.loads(config_path.read_text(encoding="utf-8"))
+@lru_cache(maxsize=8)
+def _load_accounts_config(resolved_path: str, mtime_ns: int) -> Tuple[Tuple[Tuple[str, str], ...], Optional[str]]:
+    # mtime_ns is part of the cache key so edits to the file are picked up.
+    data = json.loads(Path(resolved_path).read_text(encoding="utf-8"))
     accounts = data.get("accounts", {})
-    default_broker = data.get("default_broker")
-
     if not isinstance(accounts, dict):
         raise ValueError("accounts must be a mapping of account name to broker")
+    return tuple(accounts.items()), data.get("default_broker")
+
+
+def load_account_brokers(config_path: Path) -> Dict[str, str]:
+    """Load account-to-broker mappings from a JSON configuration file."""
+    resolved = config_path.resolve()
+    entries, default_broker = _load_accounts_config(str(resolved), resolved.stat().st_mtime_ns)
+    accounts = dict(entries)
 
     if default_broker:
         accounts.setdefault("*", default_broker)
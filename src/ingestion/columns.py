@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import csv
+import sys
+from operator import itemgetter
+from typing import Iterator, Optional, Sequence, TextIO, Tuple
+
+# Every casing of "n/a", so cells can be checked with a set lookup instead of
+# lower-casing each one.
+NOT_AVAILABLE = frozenset(("n/a", "N/a", "n/A", "N/A"))
+# Deletion tables so amounts are cleaned in one pass rather than chained replaces.
+AMOUNT_JUNK = str.maketrans("", "", "£,")
+PERCENT_JUNK = str.maketrans("", "", "%,")
+
+
+def iter_columns(handle: TextIO, columns: Sequence[str]) -> Iterator[Tuple[str, ...]]:
+    """Yield the named columns of each CSV row as a tuple, in the order given.
+
+    Columns missing from the header and cells missing from short rows come
+    back as "", and blank lines are skipped, mirroring csv.DictReader.
+    """
+    reader = csv.reader(handle)
+    header = next(reader, None)
+    if header is None:
+        return
+    positions = {name: index for index, name in enumerate(header)}
+    # Missing columns point at the first cell past the header, which is
+    # padded (short rows) or blanked (long rows) before lookup.
+    blank = len(header)
+    indices = [positions.get(name, blank) for name in columns]
+    has_missing = blank in indices
+    width = max(indices) + 1
+    getter = itemgetter(*indices)
+    single = len(indices) == 1
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
+        elif has_missing and len(row) > blank:
+            row[blank] = ""
+        values = getter(row)
+        yield (values,) if single else values
+
+
+def intern_optional(value: Optional[str]) -> Optional[str]:
+    """Intern a low-cardinality cell value such as a symbol; empty values become None.
+
+    These values repeat on nearly every row, so interning keeps one copy of each
+    and makes dict lookups keyed on them cheaper.
+    """
+    return sys.intern(value) if value else None
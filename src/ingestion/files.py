@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import os
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Sequence
+
+
+def find_files(root: Path, pattern: str) -> list[Path]:
+    """Return the files under root whose names match pattern, sorted by path.
+
+    Walks with os.scandir instead of Path.rglob, so entries come with cached
+    type info and only matches become Path objects. Like rglob, symlinked
+    directories are not followed and a missing root yields nothing.
+    """
+    files: list[Path] = []
+    pending = [str(root)] if root.is_dir() else []
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif fnmatchcase(entry.name, pattern):
+                    files.append(Path(entry.path))
+    return sorted(files)
+
+
+def list_files(root: Path, patterns: Sequence[str]) -> list[Path]:
+    """Return the files directly in root whose names match any of patterns, sorted by path.
+
+    The flat counterpart of find_files: subdirectories are not searched, and
+    a missing root yields nothing.
+    """
+    if not root.is_dir():
+        return []
+    with os.scandir(root) as entries:
+        names = [
+            entry.name
+            for entry in entries
+            if entry.is_file() and any(fnmatchcase(entry.name, pattern) for pattern in patterns)
+        ]
+    # All entries share one parent, so ordering by name matches ordering by path.
+    return [root / name for name in sorted(names)]
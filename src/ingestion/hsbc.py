@@ -1,118 +1,173 @@
 from __future__ import annotations
 
-import csv
 import hashlib
-from dataclasses import asdict
+import sys
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Optional
 
+from src.ingestion.columns import AMOUNT_JUNK, NOT_AVAILABLE, PERCENT_JUNK, intern_optional, iter_columns
 from src.normalization.holdings import HoldingRecord
+from src.normalization.ids import ID_DIGEST_SIZE
 from src.normalization.transactions import TransactionRecord
 
 
 DATE_FORMATS = ("%d %b %Y", "%d %b %Y %H:%M")
 
-DEBIT_DESCRIPTIONS = {"bought"}
-CREDIT_DESCRIPTIONS = {"sold", "cash dividend received", "interest received"}
+TRANSACTION_DESCRIPTIONS = {
+    "bought": "buy",
+    "sold": "sell",
+    "cash dividend received": "dividend",
+    "interest received": "account interest",
+}
+# Keyed on the normalized descriptions above, which is what the parser passes in.
+CASH_FLOW_SIDES = {
+    "buy": "debit",
+    "sell": "credit",
+    "dividend": "credit",
+    "account interest": "credit",
+}
 
 
+@lru_cache(maxsize=4096)
 def _parse_date(value: str) -> Optional[datetime.date]:
-    if not value or value.strip().lower() == "n/a":
+    if not value:
+        return None
+    stripped = value.strip()
+    if stripped in NOT_AVAILABLE:
         return None
-    cleaned = value.strip()
     for date_format in DATE_FORMATS:
         try:
-            return datetime.strptime(cleaned, date_format).date()
+            return datetime.strptime(stripped, date_format).date()
         except ValueError:
             continue
     raise ValueError(f"Unrecognized date format: {value}")
 
 
+@lru_cache(maxsize=4096)
 def _parse_decimal(value: str) -> Optional[Decimal]:
-    if not value or value.strip().lower() == "n/a":
+    if not value:
+        return None
+    stripped = value.strip()
+    if stripped in NOT_AVAILABLE:
         return None
-    cleaned = value.replace("£", "").replace(",", "").strip()
+    cleaned = stripped.translate(AMOUNT_JUNK).strip()
     if not cleaned:
         return None
     return Decimal(cleaned)
 
 
+@lru_cache(maxsize=4096)
 def _parse_percent(value: str) -> Optional[Decimal]:
-    if not value or value.strip().lower() == "n/a":
+    if not value:
+        return None
+    stripped = value.strip()
+    if stripped in NOT_AVAILABLE:
         return None
-    cleaned = value.replace("%", "").replace(",", "").strip()
+    cleaned = stripped.translate(PERCENT_JUNK).strip()
     if not cleaned:
         return None
     return Decimal(cleaned)
 
 
 def _normalize_text(value: str) -> Optional[str]:
-    if not value or value.strip().lower() == "n/a":
+    if not value:
         return None
-    return value.strip()
+    stripped = value.strip()
+    if stripped in NOT_AVAILABLE:
+        return None
+    return stripped
+
+
+def _normalize_currency(value: str) -> Optional[str]:
+    # Re-exports of the same statement are not consistent about code casing,
+    # which would otherwise defeat the exact-match dedupe on transaction ids.
+    currency = _normalize_text(value)
+    return sys.intern(currency.upper()) if currency else currency
 
 
 def _normalize_transaction_description(description: Optional[str]) -> Optional[str]:
-    if description is None:
-        return None
-    cleaned = description.strip()
-    if not cleaned:
+    # Callers pass the output of _normalize_text, which is already stripped.
+    if not description:
         return None
-    normalized = cleaned.casefold()
-    if normalized == "bought":
-        return "buy"
-    if normalized == "sold":
-        return "sell"
-    if normalized == "cash dividend received":
-        return "dividend"
-    if normalized == "interest received":
-        return "account interest"
-    raise ValueError(f"Unexpected transaction description: {description}")
-
-
-def _transaction_id(record: TransactionRecord) -> str:
+    normalized = TRANSACTION_DESCRIPTIONS.get(description.casefold())
+    if normalized is None:
+        raise ValueError(f"Unexpected transaction description: {description}")
+    return normalized
+
+
+def _transaction_id(
+    account_name: str,
+    broker: str,
+    trade_date: Optional[datetime.date],
+    settlement_date: Optional[datetime.date],
+    symbol: Optional[str],
+    sedol: Optional[str],
+    quantity: Optional[Decimal],
+    price: Optional[Decimal],
+    description: Optional[str],
+    reference: Optional[str],
+    debit: Optional[Decimal],
+    credit: Optional[Decimal],
+    running_balance: Optional[Decimal],
+    currency: Optional[str],
+) -> str:
     raw = "|".join(
         [
-            record.account_name,
-            record.broker,
-            record.trade_date.isoformat() if record.trade_date else "",
-            record.settlement_date.isoformat() if record.settlement_date else "",
-            record.symbol or "",
-            record.sedol or "",
-            f"{record.quantity}" if record.quantity is not None else "",
-            f"{record.price}" if record.price is not None else "",
-            record.description or "",
-            record.reference or "",
-            f"{record.debit}" if record.debit is not None else "",
-            f"{record.credit}" if record.credit is not None else "",
-            f"{record.running_balance}" if record.running_balance is not None else "",
-            record.currency or "",
+            account_name,
+            broker,
+            trade_date.isoformat() if trade_date else "",
+            settlement_date.isoformat() if settlement_date else "",
+            symbol or "",
+            sedol or "",
+            str(quantity) if quantity is not None else "",
+            str(price) if price is not None else "",
+            description or "",
+            reference or "",
+            str(debit) if debit is not None else "",
+            str(credit) if credit is not None else "",
+            str(running_balance) if running_balance is not None else "",
+            currency or "",
         ]
     )
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=ID_DIGEST_SIZE).hexdigest()
 
 
-def _snapshot_id(record: HoldingRecord) -> str:
+def _snapshot_id(
+    account_name: str,
+    broker: str,
+    valuation_date: Optional[datetime.date],
+    symbol: Optional[str],
+    name: Optional[str],
+    quantity: Optional[Decimal],
+    price: Optional[Decimal],
+    average_price: Optional[Decimal],
+    market_value: Optional[Decimal],
+    book_cost: Optional[Decimal],
+    gain_loss: Optional[Decimal],
+    gain_loss_pct: Optional[Decimal],
+    currency: Optional[str],
+) -> str:
     raw = "|".join(
         [
-            record.account_name,
-            record.broker,
-            record.valuation_date.isoformat() if record.valuation_date else "",
-            record.symbol or "",
-            record.name or "",
-            f"{record.quantity}" if record.quantity is not None else "",
-            f"{record.price}" if record.price is not None else "",
-            f"{record.average_price}" if record.average_price is not None else "",
-            f"{record.market_value}" if record.market_value is not None else "",
-            f"{record.book_cost}" if record.book_cost is not None else "",
-            f"{record.gain_loss}" if record.gain_loss is not None else "",
-            f"{record.gain_loss_pct}" if record.gain_loss_pct is not None else "",
-            record.currency or "",
+            account_name,
+            broker,
+            valuation_date.isoformat() if valuation_date else "",
+            symbol or "",
+            name or "",
+            str(quantity) if quantity is not None else "",
+            str(price) if price is not None else "",
+            str(average_price) if average_price is not None else "",
+            str(market_value) if market_value is not None else "",
+            str(book_cost) if book_cost is not None else "",
+            str(gain_loss) if gain_loss is not None else "",
+            str(gain_loss_pct) if gain_loss_pct is not None else "",
+            currency or "",
         ]
     )
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=ID_DIGEST_SIZE).hexdigest()
 
 
 def _settled_amount_to_cash_flow(
@@ -123,36 +178,75 @@ def _settled_amount_to_cash_flow(
         return None, None
     if not description:
         return None, None
-    normalized = description.strip().lower()
-    if normalized in DEBIT_DESCRIPTIONS:
+    side = CASH_FLOW_SIDES.get(description)
+    if side == "debit":
         return settled_amount, None
-    if normalized in CREDIT_DESCRIPTIONS:
+    if side == "credit":
         return None, settled_amount
     return None, None
 
 
 def parse_hsbc_transactions(path: Path, account_name: str, broker: str) -> Iterable[TransactionRecord]:
+    account_name = sys.intern(account_name)
+    broker = sys.intern(broker)
     with path.open("r", encoding="utf-8-sig", newline="") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            trade_date = _parse_date(row.get("Transaction Date", ""))
+        rows = iter_columns(
+            handle,
+            (
+                "Transaction Date",
+                "Transaction Description",
+                "Product Short Name",
+                "Product Code",
+                "No. of Units",
+                "Deal Price",
+                "Transaction Reference",
+                "Settled Amount",
+                "Settlement Currency",
+                "Price Currency",
+            ),
+        )
+        for (
+            raw_trade_date,
+            raw_description,
+            raw_symbol,
+            raw_sedol,
+            raw_quantity,
+            raw_price,
+            raw_reference,
+            raw_settled_amount,
+            raw_settlement_currency,
+            raw_price_currency,
+        ) in rows:
+            trade_date = _parse_date(raw_trade_date)
             settlement_date = trade_date
-            description = _normalize_transaction_description(
-                _normalize_text(row.get("Transaction Description", ""))
-            )
-            symbol = _normalize_text(row.get("Product Short Name", ""))
-            sedol = _normalize_text(row.get("Product Code", ""))
-            quantity = _parse_decimal(row.get("No. of Units", ""))
-            price = _parse_decimal(row.get("Deal Price", ""))
-            reference = _normalize_text(row.get("Transaction Reference", ""))
-            settled_amount = _parse_decimal(row.get("Settled Amount", ""))
+            description = _normalize_transaction_description(_normalize_text(raw_description))
+            symbol = intern_optional(_normalize_text(raw_symbol))
+            sedol = intern_optional(_normalize_text(raw_sedol))
+            quantity = _parse_decimal(raw_quantity)
+            price = _parse_decimal(raw_price)
+            reference = _normalize_text(raw_reference)
+            settled_amount = _parse_decimal(raw_settled_amount)
             debit, credit = _settled_amount_to_cash_flow(description, settled_amount)
-            currency = _normalize_text(row.get("Settlement Currency", "")) or _normalize_text(
-                row.get("Price Currency", "")
-            )
+            currency = _normalize_currency(raw_settlement_currency) or _normalize_currency(raw_price_currency)
 
-            record = TransactionRecord(
-                transaction_id="",
+            transaction_id = _transaction_id(
+                account_name=account_name,
+                broker=broker,
+                trade_date=trade_date,
+                settlement_date=settlement_date,
+                symbol=sedol,
+                sedol=sedol,
+                quantity=quantity,
+                price=price,
+                description=description,
+                reference=reference,
+                debit=debit,
+                credit=credit,
+                running_balance=None,
+                currency=currency,
+            )
+            yield TransactionRecord(
+                transaction_id=transaction_id,
                 account_name=account_name,
                 broker=broker,
                 trade_date=trade_date,
@@ -169,31 +263,73 @@ def parse_hsbc_transactions(path: Path, account_name: str, broker: str) -> Itera
                 currency=currency,
                 source_file=path.name,
             )
-            record = record.__class__(**{**asdict(record), "transaction_id": _transaction_id(record)})
-            yield record
 
 
 def parse_hsbc_holdings(path: Path, account_name: str, broker: str) -> Iterable[HoldingRecord]:
+    account_name = sys.intern(account_name)
+    broker = sys.intern(broker)
     with path.open("r", encoding="utf-8-sig", newline="") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            symbol = _normalize_text(row.get("Product Code", ""))
-            name = _normalize_text(row.get("Product Name", ""))
+        rows = iter_columns(
+            handle,
+            (
+                "Product Code",
+                "Product Name",
+                "No. of Units",
+                "Unit Price",
+                "Valuation Date",
+                "Total Value",
+                "Book Cost ",
+                "Book Cost",
+                "Gain/Loss",
+                "Gain/Loss % ",
+                "Gain/Loss %",
+                "Price Currency",
+            ),
+        )
+        for (
+            raw_symbol,
+            raw_name,
+            raw_quantity,
+            raw_price,
+            raw_valuation_date,
+            raw_market_value,
+            raw_book_cost_padded,
+            raw_book_cost,
+            raw_gain_loss,
+            raw_gain_loss_pct_padded,
+            raw_gain_loss_pct,
+            raw_currency,
+        ) in rows:
+            symbol = intern_optional(_normalize_text(raw_symbol))
+            name = _normalize_text(raw_name)
             if not symbol:
                 continue
-            quantity = _parse_decimal(row.get("No. of Units", ""))
-            price = _parse_decimal(row.get("Unit Price", ""))
-            valuation_date = _parse_date(row.get("Valuation Date", ""))
-            market_value = _parse_decimal(row.get("Total Value", ""))
-            book_cost = _parse_decimal(row.get("Book Cost ", "")) or _parse_decimal(row.get("Book Cost", ""))
-            gain_loss = _parse_decimal(row.get("Gain/Loss", ""))
-            gain_loss_pct = _parse_percent(row.get("Gain/Loss % ", "")) or _parse_percent(
-                row.get("Gain/Loss %", "")
-            )
-            currency = _normalize_text(row.get("Price Currency", ""))
+            quantity = _parse_decimal(raw_quantity)
+            price = _parse_decimal(raw_price)
+            valuation_date = _parse_date(raw_valuation_date)
+            market_value = _parse_decimal(raw_market_value)
+            book_cost = _parse_decimal(raw_book_cost_padded) or _parse_decimal(raw_book_cost)
+            gain_loss = _parse_decimal(raw_gain_loss)
+            gain_loss_pct = _parse_percent(raw_gain_loss_pct_padded) or _parse_percent(raw_gain_loss_pct)
+            currency = _normalize_currency(raw_currency)
 
-            record = HoldingRecord(
-                snapshot_id="",
+            snapshot_id = _snapshot_id(
+                account_name=account_name,
+                broker=broker,
+                valuation_date=valuation_date,
+                symbol=symbol,
+                name=name,
+                quantity=quantity,
+                price=price,
+                average_price=None,
+                market_value=market_value,
+                book_cost=book_cost,
+                gain_loss=gain_loss,
+                gain_loss_pct=gain_loss_pct,
+                currency=currency,
+            )
+            yield HoldingRecord(
+                snapshot_id=snapshot_id,
                 account_name=account_name,
                 broker=broker,
                 valuation_date=valuation_date,
@@ -209,5 +345,3 @@ def parse_hsbc_holdings(path: Path, account_name: str, broker: str) -> Iterable[
                 currency=currency,
                 source_file=path.name,
             )
-            record = record.__class__(**{**asdict(record), "snapshot_id": _snapshot_id(record)})
-            yield record
@@ -1,158 +1,264 @@
 from __future__ import annotations
 
-import csv
 import hashlib
-from dataclasses import asdict
+import sys
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Optional
 
+from src.ingestion.columns import AMOUNT_JUNK, NOT_AVAILABLE, PERCENT_JUNK, intern_optional, iter_columns
 from src.normalization.holdings import HoldingRecord
+from src.normalization.ids import ID_DIGEST_SIZE
 from src.normalization.transactions import TransactionRecord
 
 
 DATE_FORMAT = "%d/%m/%Y"
 
+PENCE_PER_POUND = Decimal("100")
 
+# Exact matches are checked before prefixes; no exact key starts with one of
+# the prefixes, so this keeps the original rule order.
+TRANSACTION_DESCRIPTIONS = {
+    "gross interest": "account interest",
+    "debit card payment": "debit card payment",
+    "total monthly fee": "fees",
+    "recommend ii": "cash advantage",
+}
+TRANSACTION_DESCRIPTION_PREFIXES = (
+    ("cash", "fees"),
+    ("div ", "dividend"),
+    ("dividend ", "dividend"),
+)
+
+
+@lru_cache(maxsize=4096)
 def _parse_date(value: str) -> Optional[datetime.date]:
-    if not value or value.strip().lower() == "n/a":
+    if not value:
+        return None
+    stripped = value.strip()
+    if stripped in NOT_AVAILABLE:
         return None
-    return datetime.strptime(value.strip(), DATE_FORMAT).date()
+    return datetime.strptime(stripped, DATE_FORMAT).date()
 
 
+@lru_cache(maxsize=4096)
 def _parse_decimal(value: str) -> Optional[Decimal]:
-    if not value or value.strip().lower() == "n/a":
+    if not value:
         return None
-    cleaned = value.replace("£", "").replace(",", "").strip()
+    stripped = value.strip()
+    if stripped in NOT_AVAILABLE:
+        return None
+    cleaned = stripped.translate(AMOUNT_JUNK).strip()
     if not cleaned:
         return None
     return Decimal(cleaned)
 
 
+@lru_cache(maxsize=4096)
 def _parse_percent(value: str) -> Optional[Decimal]:
-    if not value or value.strip().lower() == "n/a":
+    if not value:
+        return None
+    stripped = value.strip()
+    if stripped in NOT_AVAILABLE:
         return None
-    cleaned = value.replace("%", "").replace(",", "").strip()
+    cleaned = stripped.translate(PERCENT_JUNK).strip()
     if not cleaned:
         return None
     return Decimal(cleaned)
 
 
+@lru_cache(maxsize=4096)
 def _parse_price(value: str) -> Optional[Decimal]:
-    if not value or value.strip().lower() == "n/a":
+    if not value:
+        return None
+    stripped = value.strip()
+    if stripped in NOT_AVAILABLE:
         return None
-    cleaned = value.replace("£", "").replace(",", "").strip()
+    cleaned = stripped.translate(AMOUNT_JUNK).strip()
     if not cleaned:
         return None
     if cleaned.endswith("p"):
         pence = cleaned[:-1].strip()
         if not pence:
             return None
-        return Decimal(pence) / Decimal("100")
+        return Decimal(pence) / PENCE_PER_POUND
     return Decimal(cleaned)
 
 
 def _normalize_text(value: str) -> Optional[str]:
-    if not value or value.strip().lower() == "n/a":
+    if not value:
         return None
-    return value.strip()
+    stripped = value.strip()
+    if stripped in NOT_AVAILABLE:
+        return None
+    return stripped
 
 
 def _normalize_transaction_description(description: Optional[str]) -> Optional[str]:
-    if description is None:
-        return None
-    cleaned = description.strip()
-    if not cleaned:
+    # description has been through _normalize_text, so only its case needs folding.
+    if not description:
         return None
-    normalized = cleaned.casefold()
-    if normalized == "gross interest":
-        return "account interest"
-    if normalized == "debit card payment":
-        return "debit card payment"
-    if normalized == "total monthly fee" or normalized.startswith("cash"):
-        return "fees"
-    if normalized == "recommend ii" or normalized.startswith("cash"):
-        return "cash advantage"
-    if normalized.startswith("div ") or normalized.startswith("dividend "):
-        return "dividend"
+    normalized = description.casefold()
+    mapped = TRANSACTION_DESCRIPTIONS.get(normalized)
+    if mapped is not None:
+        return mapped
+    for prefix, mapped in TRANSACTION_DESCRIPTION_PREFIXES:
+        if normalized.startswith(prefix):
+            return mapped
     if " del " in normalized or " bal " in normalized:
-        return "buy/sell" 
+        return "buy/sell"
     raise ValueError(f"Unexpected transaction description: {description}")
 
 
-def _transaction_id(record: TransactionRecord) -> str:
+def _transaction_id(
+    account_name: str,
+    broker: str,
+    trade_date: Optional[datetime.date],
+    settlement_date: Optional[datetime.date],
+    symbol: Optional[str],
+    sedol: Optional[str],
+    quantity: Optional[Decimal],
+    price: Optional[Decimal],
+    description: Optional[str],
+    reference: Optional[str],
+    debit: Optional[Decimal],
+    credit: Optional[Decimal],
+    running_balance: Optional[Decimal],
+    currency: Optional[str],
+) -> str:
     raw = "|".join(
         [
-            record.account_name,
-            record.broker,
-            record.trade_date.isoformat() if record.trade_date else "",
-            record.settlement_date.isoformat() if record.settlement_date else "",
-            record.symbol or "",
-            record.sedol or "",
-            f"{record.quantity}" if record.quantity is not None else "",
-            f"{record.price}" if record.price is not None else "",
-            record.description or "",
-            record.reference or "",
-            f"{record.debit}" if record.debit is not None else "",
-            f"{record.credit}" if record.credit is not None else "",
-            f"{record.running_balance}" if record.running_balance is not None else "",
-            record.currency or "",
+            account_name,
+            broker,
+            trade_date.isoformat() if trade_date else "",
+            settlement_date.isoformat() if settlement_date else "",
+            symbol or "",
+            sedol or "",
+            str(quantity) if quantity is not None else "",
+            str(price) if price is not None else "",
+            description or "",
+            reference or "",
+            str(debit) if debit is not None else "",
+            str(credit) if credit is not None else "",
+            str(running_balance) if running_balance is not None else "",
+            currency or "",
         ]
     )
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=ID_DIGEST_SIZE).hexdigest()
 
 
-def _snapshot_id(record: HoldingRecord) -> str:
+def _snapshot_id(
+    account_name: str,
+    broker: str,
+    valuation_date: Optional[datetime.date],
+    symbol: Optional[str],
+    name: Optional[str],
+    quantity: Optional[Decimal],
+    price: Optional[Decimal],
+    average_price: Optional[Decimal],
+    market_value: Optional[Decimal],
+    book_cost: Optional[Decimal],
+    gain_loss: Optional[Decimal],
+    gain_loss_pct: Optional[Decimal],
+    currency: Optional[str],
+) -> str:
     raw = "|".join(
         [
-            record.account_name,
-            record.broker,
-            record.valuation_date.isoformat() if record.valuation_date else "",
-            record.symbol or "",
-            record.name or "",
-            f"{record.quantity}" if record.quantity is not None else "",
-            f"{record.price}" if record.price is not None else "",
-            f"{record.average_price}" if record.average_price is not None else "",
-            f"{record.market_value}" if record.market_value is not None else "",
-            f"{record.book_cost}" if record.book_cost is not None else "",
-            f"{record.gain_loss}" if record.gain_loss is not None else "",
-            f"{record.gain_loss_pct}" if record.gain_loss_pct is not None else "",
-            record.currency or "",
+            account_name,
+            broker,
+            valuation_date.isoformat() if valuation_date else "",
+            symbol or "",
+            name or "",
+            str(quantity) if quantity is not None else "",
+            str(price) if price is not None else "",
+            str(average_price) if average_price is not None else "",
+            str(market_value) if market_value is not None else "",
+            str(book_cost) if book_cost is not None else "",
+            str(gain_loss) if gain_loss is not None else "",
+            str(gain_loss_pct) if gain_loss_pct is not None else "",
+            currency or "",
         ]
     )
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=ID_DIGEST_SIZE).hexdigest()
 
 
 def parse_ii_transactions(path: Path, account_name: str, broker: str) -> Iterable[TransactionRecord]:
+    account_name = sys.intern(account_name)
+    broker = sys.intern(broker)
     with path.open("r", encoding="utf-8-sig", newline="") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            trade_date = _parse_date(row.get("Date", ""))
-            settlement_date = _parse_date(row.get("Settlement Date", ""))
-            symbol = _normalize_text(row.get("Symbol", ""))
-            sedol = _normalize_text(row.get("Sedol", ""))
-            quantity = _parse_decimal(row.get("Quantity", ""))
-            price = _parse_decimal(row.get("Price", ""))
-            description = _normalize_transaction_description(_normalize_text(row.get("Description", "")))
-            reference = _normalize_text(row.get("Reference", ""))
-            debit = _parse_decimal(row.get("Debit", ""))
-            credit = _parse_decimal(row.get("Credit", ""))
+        rows = iter_columns(
+            handle,
+            (
+                "Date",
+                "Settlement Date",
+                "Symbol",
+                "Sedol",
+                "Quantity",
+                "Price",
+                "Description",
+                "Reference",
+                "Debit",
+                "Credit",
+                "Running Balance",
+            ),
+        )
+        for (
+            raw_trade_date,
+            raw_settlement_date,
+            raw_symbol,
+            raw_sedol,
+            raw_quantity,
+            raw_price,
+            raw_description,
+            raw_reference,
+            raw_debit,
+            raw_credit,
+            raw_running_balance,
+        ) in rows:
+            trade_date = _parse_date(raw_trade_date)
+            settlement_date = _parse_date(raw_settlement_date)
+            symbol = intern_optional(_normalize_text(raw_symbol))
+            sedol = intern_optional(_normalize_text(raw_sedol))
+            symbol = symbol or sedol  # replace symbol with sedol if missing
+            quantity = _parse_decimal(raw_quantity)
+            price = _parse_decimal(raw_price)
+            description = _normalize_transaction_description(_normalize_text(raw_description))
+            reference = _normalize_text(raw_reference)
+            debit = _parse_decimal(raw_debit)
+            credit = _parse_decimal(raw_credit)
             # refine description 
             if description == "buy/sell":
                 if debit is not None and credit is None:
                     description = "buy"
                 elif credit is not None and debit is None:
                     description = "sell"
-            running_balance = _parse_decimal(row.get("Running Balance", ""))
+            running_balance = _parse_decimal(raw_running_balance)
 
-            record = TransactionRecord(
-                transaction_id="",
+            transaction_id = _transaction_id(
+                account_name=account_name,
+                broker=broker,
+                trade_date=trade_date,
+                settlement_date=settlement_date,
+                symbol=symbol,
+                sedol=sedol,
+                quantity=quantity,
+                price=price,
+                description=description,
+                reference=reference,
+                debit=debit,
+                credit=credit,
+                running_balance=running_balance,
+                currency="GBP",
+            )
+            yield TransactionRecord(
+                transaction_id=transaction_id,
                 account_name=account_name,
                 broker=broker,
                 trade_date=trade_date,
                 settlement_date=settlement_date,
-                symbol=symbol or sedol, # replace symbol with sedol if missing
+                symbol=symbol,
                 sedol=sedol,
                 quantity=quantity,
                 price=price,
@@ -164,8 +270,6 @@ def parse_ii_transactions(path: Path, account_name: str, broker: str) -> Iterabl
                 currency="GBP",
                 source_file=path.name,
             )
-            record = record.__class__(**{**asdict(record), "transaction_id": _transaction_id(record)})
-            yield record
 
 
 def parse_ii_holdings(
@@ -174,23 +278,65 @@ def parse_ii_holdings(
     broker: str,
     valuation_date: datetime.date,
 ) -> Iterable[HoldingRecord]:
+    account_name = sys.intern(account_name)
+    broker = sys.intern(broker)
     with path.open("r", encoding="utf-8-sig", newline="") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            symbol = _normalize_text(row.get("Symbol", ""))
-            name = _normalize_text(row.get("Name", ""))
+        rows = iter_columns(
+            handle,
+            (
+                "Symbol",
+                "Name",
+                "Qty",
+                "Price",
+                "Market Value £",
+                "Market Value",
+                "Book Cost",
+                "Gain/Loss",
+                "Gain/Loss %",
+                "Average Price",
+            ),
+        )
+        for (
+            raw_symbol,
+            raw_name,
+            raw_quantity,
+            raw_price,
+            raw_market_value_gbp,
+            raw_market_value,
+            raw_book_cost,
+            raw_gain_loss,
+            raw_gain_loss_pct,
+            raw_average_price,
+        ) in rows:
+            symbol = intern_optional(_normalize_text(raw_symbol))
+            name = _normalize_text(raw_name)
             if not symbol:
                 continue
-            quantity = _parse_decimal(row.get("Qty", ""))
-            price = _parse_price(row.get("Price", ""))
-            market_value = _parse_decimal(row.get("Market Value £", "")) or _parse_decimal(row.get("Market Value", ""))
-            book_cost = _parse_decimal(row.get("Book Cost", ""))
-            gain_loss = _parse_decimal(row.get("Gain/Loss", ""))
-            gain_loss_pct = _parse_percent(row.get("Gain/Loss %", ""))
-            average_price = _parse_price(row.get("Average Price", ""))
-
-            record = HoldingRecord(
-                snapshot_id="",
+            quantity = _parse_decimal(raw_quantity)
+            price = _parse_price(raw_price)
+            market_value = _parse_decimal(raw_market_value_gbp) or _parse_decimal(raw_market_value)
+            book_cost = _parse_decimal(raw_book_cost)
+            gain_loss = _parse_decimal(raw_gain_loss)
+            gain_loss_pct = _parse_percent(raw_gain_loss_pct)
+            average_price = _parse_price(raw_average_price)
+
+            snapshot_id = _snapshot_id(
+                account_name=account_name,
+                broker=broker,
+                valuation_date=valuation_date,
+                symbol=symbol,
+                name=name,
+                quantity=quantity,
+                price=price,
+                average_price=average_price,
+                market_value=market_value,
+                book_cost=book_cost,
+                gain_loss=gain_loss,
+                gain_loss_pct=gain_loss_pct,
+                currency="GBP",
+            )
+            yield HoldingRecord(
+                snapshot_id=snapshot_id,
                 account_name=account_name,
                 broker=broker,
                 valuation_date=valuation_date,
@@ -206,5 +352,3 @@ def parse_ii_holdings(
                 currency="GBP",
                 source_file=path.name,
             )
-            record = record.__class__(**{**asdict(record), "snapshot_id": _snapshot_id(record)})
-            yield record
@@ -1,21 +1,25 @@
 from __future__ import annotations
 
-import csv
+import sys
 from datetime import date
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Collection, Iterator, Optional
 
+from src.ingestion.columns import intern_optional, iter_columns
 from src.normalization.holdings import HoldingRecord
 from src.normalization.transactions import TransactionRecord
 
 
+@lru_cache(maxsize=4096)
 def _parse_date(value: str) -> Optional[date]:
     if not value:
         return None
     return date.fromisoformat(value)
 
 
+@lru_cache(maxsize=4096)
 def _parse_decimal(value: str) -> Optional[Decimal]:
     if not value:
         return None
@@ -32,53 +36,130 @@ def _valuation_date_from_path(path: Path) -> Optional[date]:
     return None
 
 
-def read_normalized_transactions(path: Path) -> Iterator[TransactionRecord]:
+def read_normalized_transactions(
+    path: Path,
+    descriptions: Optional[Collection[str]] = None,
+) -> Iterator[TransactionRecord]:
     with path.open("r", encoding="utf-8", newline="") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
+        rows = iter_columns(
+            handle,
+            (
+                "transaction_id",
+                "account_name",
+                "broker",
+                "trade_date",
+                "settlement_date",
+                "symbol",
+                "sedol",
+                "quantity",
+                "price",
+                "description",
+                "reference",
+                "debit",
+                "credit",
+                "running_balance",
+                "currency",
+                "source_file",
+            ),
+        )
+        for (
+            transaction_id,
+            account_name,
+            broker,
+            trade_date,
+            settlement_date,
+            symbol,
+            sedol,
+            quantity,
+            price,
+            description,
+            reference,
+            debit,
+            credit,
+            running_balance,
+            currency,
+            source_file,
+        ) in rows:
+            # Filter before parsing so skipped rows cost no Decimal/date work.
+            if descriptions is not None and description not in descriptions:
+                continue
             yield TransactionRecord(
-                transaction_id=row.get("transaction_id", ""),
-                account_name=row.get("account_name", ""),
-                broker=row.get("broker", ""),
-                trade_date=_parse_date(row.get("trade_date", "")),
-                settlement_date=_parse_date(row.get("settlement_date", "")),
-                symbol=row.get("symbol") or None,
-                sedol=row.get("sedol") or None,
-                quantity=_parse_decimal(row.get("quantity", "")),
-                price=_parse_decimal(row.get("price", "")),
-                description=row.get("description") or None,
-                reference=row.get("reference") or None,
-                debit=_parse_decimal(row.get("debit", "")),
-                credit=_parse_decimal(row.get("credit", "")),
-                running_balance=_parse_decimal(row.get("running_balance", "")),
-                currency=row.get("currency") or None,
-                source_file=row.get("source_file", ""),
+                transaction_id=transaction_id,
+                account_name=sys.intern(account_name),
+                broker=sys.intern(broker),
+                trade_date=_parse_date(trade_date),
+                settlement_date=_parse_date(settlement_date),
+                symbol=intern_optional(symbol),
+                sedol=intern_optional(sedol),
+                quantity=_parse_decimal(quantity),
+                price=_parse_decimal(price),
+                description=intern_optional(description),
+                reference=reference or None,
+                debit=_parse_decimal(debit),
+                credit=_parse_decimal(credit),
+                running_balance=_parse_decimal(running_balance),
+                currency=intern_optional(currency),
+                source_file=source_file,
             )
 
 
 def read_normalized_holdings(path: Path) -> Iterator[HoldingRecord]:
     fallback_date = _valuation_date_from_path(path)
     with path.open("r", encoding="utf-8", newline="") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            valuation_date = _parse_date(row.get("valuation_date", "")) or fallback_date
-            symbol = row.get("symbol") or ""
+        rows = iter_columns(
+            handle,
+            (
+                "snapshot_id",
+                "account_name",
+                "broker",
+                "valuation_date",
+                "symbol",
+                "name",
+                "quantity",
+                "price",
+                "average_price",
+                "market_value",
+                "book_cost",
+                "gain_loss",
+                "gain_loss_pct",
+                "currency",
+                "source_file",
+            ),
+        )
+        for (
+            snapshot_id,
+            account_name,
+            broker,
+            raw_valuation_date,
+            symbol,
+            name,
+            quantity,
+            price,
+            average_price,
+            market_value,
+            book_cost,
+            gain_loss,
+            gain_loss_pct,
+            currency,
+            source_file,
+        ) in rows:
+            valuation_date = _parse_date(raw_valuation_date) or fallback_date
             if valuation_date is None or not symbol:
                 continue
             yield HoldingRecord(
-                snapshot_id=row.get("snapshot_id", ""),
-                account_name=row.get("account_name", ""),
-                broker=row.get("broker", ""),
+                snapshot_id=snapshot_id,
+                account_name=sys.intern(account_name),
+                broker=sys.intern(broker),
                 valuation_date=valuation_date,
-                symbol=symbol,
-                name=row.get("name") or None,
-                quantity=_parse_decimal(row.get("quantity", "")),
-                price=_parse_decimal(row.get("price", "")),
-                average_price=_parse_decimal(row.get("average_price", "")),
-                market_value=_parse_decimal(row.get("market_value", "")),
-                book_cost=_parse_decimal(row.get("book_cost", "")),
-                gain_loss=_parse_decimal(row.get("gain_loss", "")),
-                gain_loss_pct=_parse_decimal(row.get("gain_loss_pct", "")),
-                currency=row.get("currency") or None,
-                source_file=row.get("source_file", ""),
-            )
\ No newline at end of file
+                symbol=sys.intern(symbol),
+                name=name or None,
+                quantity=_parse_decimal(quantity),
+                price=_parse_decimal(price),
+                average_price=_parse_decimal(average_price),
+                market_value=_parse_decimal(market_value),
+                book_cost=_parse_decimal(book_cost),
+                gain_loss=_parse_decimal(gain_loss),
+                gain_loss_pct=_parse_decimal(gain_loss_pct),
+                currency=intern_optional(currency),
+                source_file=source_file,
+            )
@@ -3,10 +3,28 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
+HOLDING_FIELDS = (
+    "snapshot_id",
+    "account_name",
+    "broker",
+    "valuation_date",
+    "symbol",
+    "name",
+    "quantity",
+    "price",
+    "average_price",
+    "market_value",
+    "book_cost",
+    "gain_loss",
+    "gain_loss_pct",
+    "currency",
+    "source_file",
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class HoldingRecord:
     snapshot_id: str
     account_name: str
@@ -24,21 +42,24 @@ class HoldingRecord:
     currency: Optional[str]
     source_file: str
 
+    def to_row(self) -> Tuple[str, ...]:
+        return (
+            self.snapshot_id,
+            self.account_name,
+            self.broker,
+            self.valuation_date.isoformat() if self.valuation_date else "",
+            self.symbol or "",
+            self.name or "",
+            str(self.quantity) if self.quantity is not None else "",
+            str(self.price) if self.price is not None else "",
+            str(self.average_price) if self.average_price is not None else "",
+            str(self.market_value) if self.market_value is not None else "",
+            str(self.book_cost) if self.book_cost is not None else "",
+            str(self.gain_loss) if self.gain_loss is not None else "",
+            str(self.gain_loss_pct) if self.gain_loss_pct is not None else "",
+            self.currency or "",
+            self.source_file,
+        )
+
     def to_dict(self) -> Dict[str, str]:
-        return {
-            "snapshot_id": self.snapshot_id,
-            "account_name": self.account_name,
-            "broker": self.broker,
-            "valuation_date": self.valuation_date.isoformat() if self.valuation_date else "",
-            "symbol": self.symbol or "",
-            "name": self.name or "",
-            "quantity": f"{self.quantity}" if self.quantity is not None else "",
-            "price": f"{self.price}" if self.price is not None else "",
-            "average_price": f"{self.average_price}" if self.average_price is not None else "",
-            "market_value": f"{self.market_value}" if self.market_value is not None else "",
-            "book_cost": f"{self.book_cost}" if self.book_cost is not None else "",
-            "gain_loss": f"{self.gain_loss}" if self.gain_loss is not None else "",
-            "gain_loss_pct": f"{self.gain_loss_pct}" if self.gain_loss_pct is not None else "",
-            "currency": self.currency or "",
-            "source_file": self.source_file,
-        }
+        return dict(zip(HOLDING_FIELDS, self.to_row()))
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+# Transaction and snapshot ids are only used as dedupe keys, so BLAKE2b (faster
+# than SHA-256 on 64-bit CPUs) with a 16-byte digest keeps collisions negligible.
+ID_DIGEST_SIZE = 16
+
+
+def dedupe_key(record_id: str) -> int:
+    # Hex ids stored as ints take roughly half the memory in a set. All 128
+    # bits of the digest are kept, so the key is exactly as unique as the id.
+    return int(record_id, 16)
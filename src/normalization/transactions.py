@@ -3,10 +3,29 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
+TRANSACTION_FIELDS = (
+    "transaction_id",
+    "account_name",
+    "broker",
+    "trade_date",
+    "settlement_date",
+    "symbol",
+    "sedol",
+    "quantity",
+    "price",
+    "description",
+    "reference",
+    "debit",
+    "credit",
+    "running_balance",
+    "currency",
+    "source_file",
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TransactionRecord:
     transaction_id: str
     account_name: str
@@ -25,22 +44,25 @@ class TransactionRecord:
     currency: Optional[str]
     source_file: str
 
+    def to_row(self) -> Tuple[str, ...]:
+        return (
+            self.transaction_id,
+            self.account_name,
+            self.broker,
+            self.trade_date.isoformat() if self.trade_date else "",
+            self.settlement_date.isoformat() if self.settlement_date else "",
+            self.symbol or "",
+            self.sedol or "",
+            str(self.quantity) if self.quantity is not None else "",
+            str(self.price) if self.price is not None else "",
+            self.description or "",
+            self.reference or "",
+            str(self.debit) if self.debit is not None else "",
+            str(self.credit) if self.credit is not None else "",
+            str(self.running_balance) if self.running_balance is not None else "",
+            self.currency or "",
+            self.source_file,
+        )
+
     def to_dict(self) -> Dict[str, str]:
-        return {
-            "transaction_id": self.transaction_id,
-            "account_name": self.account_name,
-            "broker": self.broker,
-            "trade_date": self.trade_date.isoformat() if self.trade_date else "",
-            "settlement_date": self.settlement_date.isoformat() if self.settlement_date else "",
-            "symbol": self.symbol or "",
-            "sedol": self.sedol or "",
-            "quantity": f"{self.quantity}" if self.quantity is not None else "",
-            "price": f"{self.price}" if self.price is not None else "",
-            "description": self.description or "",
-            "reference": self.reference or "",
-            "debit": f"{self.debit}" if self.debit is not None else "",
-            "credit": f"{self.credit}" if self.credit is not None else "",
-            "running_balance": f"{self.running_balance}" if self.running_balance is not None else "",
-            "currency": self.currency or "",
-            "source_file": self.source_file,
-        }
+        return dict(zip(TRANSACTION_FIELDS, self.to_row()))
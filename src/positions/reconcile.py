@@ -1,16 +1,20 @@
 from __future__ import annotations
 
-import csv
+import sys
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterator, Optional
 
+from src.ingestion.columns import intern_optional, iter_columns
 from src.positions.transaction_utils import build_positions
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransactionRow:
     account_name: str
     trade_date: Optional[date]
@@ -22,7 +26,7 @@ class TransactionRow:
     credit: Optional[Decimal]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PositionMismatch:
     account_name: str
     valuation_date: date
@@ -32,44 +36,56 @@ class PositionMismatch:
     delta: Decimal
 
 
+@lru_cache(maxsize=4096)
 def _parse_date(value: str) -> Optional[date]:
     if not value:
         return None
     return date.fromisoformat(value)
 
 
+@lru_cache(maxsize=4096)
 def _parse_decimal(value: str) -> Optional[Decimal]:
     if not value:
         return None
     return Decimal(value)
 
 
-def _read_transactions(path: Path) -> Iterable[TransactionRow]:
+def _read_transactions(path: Path) -> Iterator[TransactionRow]:
     with path.open("r", encoding="utf-8", newline="") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
+        rows = iter_columns(
+            handle,
+            (
+                "account_name",
+                "trade_date",
+                "settlement_date",
+                "symbol",
+                "quantity",
+                "description",
+                "debit",
+                "credit",
+            ),
+        )
+        for account_name, trade_date, settlement_date, symbol, quantity, description, debit, credit in rows:
             yield TransactionRow(
-                account_name=row.get("account_name", ""),
-                trade_date=_parse_date(row.get("trade_date", "")),
-                settlement_date=_parse_date(row.get("settlement_date", "")),
-                symbol=row.get("symbol") or None,
-                quantity=_parse_decimal(row.get("quantity", "")),
-                description=row.get("description") or None,
-                debit=_parse_decimal(row.get("debit", "")),
-                credit=_parse_decimal(row.get("credit", "")),
+                account_name=sys.intern(account_name),
+                trade_date=_parse_date(trade_date),
+                settlement_date=_parse_date(settlement_date),
+                symbol=intern_optional(symbol),
+                quantity=_parse_decimal(quantity),
+                description=intern_optional(description),
+                debit=_parse_decimal(debit),
+                credit=_parse_decimal(credit),
             )
 
 
 def _read_holdings(path: Path) -> Dict[str, Decimal]:
     holdings: Dict[str, Decimal] = {}
     with path.open("r", encoding="utf-8", newline="") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            symbol = row.get("symbol") or ""
-            quantity = _parse_decimal(row.get("quantity", ""))
+        for symbol, raw_quantity in iter_columns(handle, ("symbol", "quantity")):
+            quantity = _parse_decimal(raw_quantity)
             if not symbol or quantity is None:
                 continue
-            holdings[symbol] = quantity
+            holdings[sys.intern(symbol)] = quantity
     return holdings
 
 
@@ -78,27 +94,42 @@ def reconcile_positions(
     holdings_path: Path,
     valuation_date: date,
 ) -> list[PositionMismatch]:
-    transactions = list(_read_transactions(transactions_path))
-    positions = build_positions(transactions, valuation_date)
+    # Stream rows straight into build_positions; only the first row is kept,
+    # for its account name.
+    transactions = _read_transactions(transactions_path)
+    first = next(transactions, None)
+    if first is None:
+        account_name = holdings_path.parent.name
+        positions = build_positions((), valuation_date)
+    else:
+        account_name = first.account_name
+        positions = build_positions(chain((first,), transactions), valuation_date)
     holdings = _read_holdings(holdings_path)
 
-    mismatches: list[PositionMismatch] = []
-    symbols = set(positions) | set(holdings)
-    account_name = transactions[0].account_name if transactions else holdings_path.parent.name
-
-    for symbol in sorted(symbols):
-        holdings_qty = holdings.get(symbol, Decimal("0"))
-        transaction_qty = positions.get(symbol, Decimal("0"))
+    # One pass over each side, then sort only the (usually few) mismatches.
+    zero = Decimal("0")
+    deltas: list[tuple[str, Decimal, Decimal, Decimal]] = []
+    for symbol, holdings_qty in holdings.items():
+        transaction_qty = positions.get(symbol, zero)
         delta = holdings_qty - transaction_qty
         if delta != 0:
-            mismatches.append(
-                PositionMismatch(
-                    account_name=account_name,
-                    valuation_date=valuation_date,
-                    symbol=symbol,
-                    holdings_quantity=holdings_qty,
-                    transaction_quantity=transaction_qty,
-                    delta=delta,
-                )
-            )
-    return mismatches
+            deltas.append((symbol, holdings_qty, transaction_qty, delta))
+    for symbol, transaction_qty in positions.items():
+        if symbol in holdings:
+            continue
+        delta = zero - transaction_qty
+        if delta != 0:
+            deltas.append((symbol, zero, transaction_qty, delta))
+    deltas.sort(key=itemgetter(0))
+
+    return [
+        PositionMismatch(
+            account_name=account_name,
+            valuation_date=valuation_date,
+            symbol=symbol,
+            holdings_quantity=holdings_qty,
+            transaction_quantity=transaction_qty,
+            delta=delta,
+        )
+        for symbol, holdings_qty, transaction_qty, delta in deltas
+    ]
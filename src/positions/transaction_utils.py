@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
-from typing import Dict, Iterable, Optional, Protocol
+from typing import DefaultDict, Dict, Iterable, Optional, Protocol
 
 from src.normalization.transactions import TransactionRecord
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PositionCost:
     quantity: Decimal
     book_cost: Decimal
 
 
+# Decimal and PositionCost are immutable, so one shared zero/empty instance
+# serves every lookup miss instead of being rebuilt per transaction.
+ZERO = Decimal("0")
+EMPTY_POSITION = PositionCost(quantity=ZERO, book_cost=ZERO)
+
+
 class TransactionLike(Protocol):
     trade_date: Optional[date]
     settlement_date: Optional[date]
@@ -57,18 +64,28 @@ def build_positions(
     transactions: Iterable[TransactionLike],
     valuation_date: date,
 ) -> Dict[str, Decimal]:
-    positions: Dict[str, Decimal] = {}
+    # Decimal() is Decimal("0"); += then does a single dict update per row.
+    positions: DefaultDict[str, Decimal] = defaultdict(Decimal)
     for record in transactions:
+        # Inlined infer_signed_quantity_from_fields; this loop is hot.
+        quantity = record.quantity
+        if quantity is None:
+            continue
+        description = record.description
+        if description == "buy":
+            signed_quantity = quantity
+        elif description == "sell":
+            signed_quantity = -quantity
+        else:
+            continue
         effective = record.trade_date or record.settlement_date
         if not effective or effective > valuation_date:
             continue
-        if not record.symbol:
-            continue
-        signed_quantity = infer_signed_quantity_from_fields(record.quantity, record.description)
-        if signed_quantity is None:
+        symbol = record.symbol
+        if not symbol:
             continue
-        positions[record.symbol] = positions.get(record.symbol, Decimal("0")) + signed_quantity
-    return positions
+        positions[symbol] += signed_quantity
+    return dict(positions)
 
 
 def apply_transaction_to_position_costs(
@@ -79,8 +96,8 @@ def apply_transaction_to_position_costs(
     if signed_quantity is None or not record.symbol:
         return None
     if signed_quantity > 0:
-        value = transaction_value(record, signed_quantity) or Decimal("0")
-        position = positions.get(record.symbol, PositionCost(quantity=Decimal("0"), book_cost=Decimal("0")))
+        value = transaction_value(record, signed_quantity) or ZERO
+        position = positions.get(record.symbol, EMPTY_POSITION)
         positions[record.symbol] = PositionCost(
             quantity=position.quantity + signed_quantity,
             book_cost=position.book_cost + value,
@@ -90,9 +107,9 @@ def apply_transaction_to_position_costs(
     if proceeds is None:
         return None
     sell_quantity = -signed_quantity
-    position = positions.get(record.symbol, PositionCost(quantity=Decimal("0"), book_cost=Decimal("0")))
+    position = positions.get(record.symbol, EMPTY_POSITION)
     if position.quantity == 0:
-        average_cost = Decimal("0")
+        average_cost = ZERO
     else:
         average_cost = position.book_cost / position.quantity
     cost_basis = average_cost * sell_quantity
@@ -1,37 +1,39 @@
 from __future__ import annotations
 
 import csv
-from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
 
+from src.ingestion.files import find_files
 from src.ingestion.normalized import read_normalized_transactions
-from src.normalization.transactions import TransactionRecord
 from src.positions.transaction_utils import (
+    ZERO,
     PositionCost,
     apply_transaction_to_position_costs,
     effective_date,
 )
+from src.reporting.parallel import parallel_map
 
 
 INCOME_DESCRIPTIONS = {"dividend", "account interest", "fees", "cash advantage"}
+# Sells are reported as realized gains, and buys are needed for their cost basis.
+REPORTED_DESCRIPTIONS = INCOME_DESCRIPTIONS | {"buy", "sell"}
+
+INCOME_SUMMARY_FIELDS = (
+    "account_name",
+    "month",
+    "symbol",
+    "description",
+    "total_amount",
+)
 
 
-@dataclass(frozen=True)
-class IncomeRecord:
-    account_name: str
-    trade_date: Optional[date]
-    symbol: Optional[str]
-    description: Optional[str]
-    debit: Optional[Decimal]
-    credit: Optional[Decimal]
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IncomeSummary:
     account_name: str
     month: str
@@ -39,92 +41,112 @@ class IncomeSummary:
     description: str
     total_amount: Decimal
 
+    def to_row(self) -> Tuple[str, ...]:
+        return (
+            self.account_name,
+            self.month,
+            self.symbol,
+            self.description,
+            str(self.total_amount),
+        )
+
     def to_dict(self) -> Dict[str, str]:
-        return {
-            "account_name": self.account_name,
-            "month": self.month,
-            "symbol": self.symbol,
-            "description": self.description,
-            "total_amount": f"{self.total_amount}",
-        }
+        return dict(zip(INCOME_SUMMARY_FIELDS, self.to_row()))
+
+
+def _month_key(value: Optional[date]) -> Optional[int]:
+    # Months are totalled under an integer key and formatted once per distinct
+    # month in _format_month, instead of calling strftime for every row.
+    if value is None:
+        return None
+    return value.year * 12 + value.month - 1
+
+
+def _format_month(key: Optional[int]) -> str:
+    if key is None:
+        return "unknown"
+    year, month_index = divmod(key, 12)
+    return date(year, month_index + 1, 1).strftime("%Y-%m")
 
 
-def _income_records_from_transactions(transactions: Iterable[TransactionRecord]) -> Iterator[IncomeRecord]:
+def _income_totals(path: Path) -> Dict[Tuple[str, Optional[int], str, str], Decimal]:
+    totals: Dict[Tuple[str, Optional[int], str, str], Decimal] = {}
     positions: Dict[str, PositionCost] = {}
-    sorted_transactions = sorted(
-        [record for record in transactions if effective_date(record)],
-        key=lambda record: effective_date(record),
-    )
-    for record in sorted_transactions:
-        effective_date_value = effective_date(record)
-        if record.description in INCOME_DESCRIPTIONS:
-            yield IncomeRecord(
-                account_name=record.account_name,
-                trade_date=effective_date_value,
-                symbol=record.symbol,
-                description=record.description,
-                debit=record.debit,
-                credit=record.credit,
-            )
+    transactions = read_normalized_transactions(path, REPORTED_DESCRIPTIONS)
+    # Sort (date, record) pairs on the precomputed date. Normalized files are
+    # written in trade-date order, and Timsort finishes already-ordered input
+    # in a single linear pass, so no pre-check is needed.
+    dated_transactions = [
+        (effective_date_value, record)
+        for record in transactions
+        if (effective_date_value := effective_date(record))
+    ]
+    dated_transactions.sort(key=itemgetter(0))
+    # Each transaction goes straight from the reader into its total; no
+    # intermediate per-row income record is built.
+    for effective_date_value, record in dated_transactions:
+        description = record.description
+        if description in INCOME_DESCRIPTIONS:
+            debit = record.debit
+            credit = record.credit
+        elif description == "buy":
+            apply_transaction_to_position_costs(record, positions)
             continue
-        if record.description in {"buy", "sell"}:
+        elif description == "sell":
             gain = apply_transaction_to_position_costs(record, positions)
-            if record.description == "buy":
-                continue
             if gain is None:
                 continue
-            debit = None
-            credit = None
+            description = "sell of securities"
             if gain >= 0:
-                credit = gain
+                debit, credit = None, gain
             else:
-                debit = -gain
-            yield IncomeRecord(
-                account_name=record.account_name,
-                trade_date=effective_date_value,
-                symbol=record.symbol,
-                description="sell of securities",
-                debit=debit,
-                credit=credit,
-            )
-
-
-def _month_key(value: Optional[date]) -> str:
-    if value is None:
-        return "unknown"
-    return value.strftime("%Y-%m")
-
-
-def _amount(record: IncomeRecord) -> Decimal:
-    debit = record.debit or Decimal("0")
-    credit = record.credit or Decimal("0")
-    return credit - debit
+                debit, credit = -gain, None
+        else:
+            continue
+        # Apply debit and credit to the running total directly rather than
+        # building a per-row amount with two zero defaults. Zero amounts are
+        # skipped like missing ones, as `or ZERO` did, so a Decimal("0.0") cell
+        # does not change the scale a zero total is written with.
+        key = (
+            record.account_name or "unknown",
+            _month_key(effective_date_value),
+            record.symbol or "CASH",
+            description,
+        )
+        total = totals.get(key, ZERO)
+        if credit:
+            total += credit
+        if debit:
+            total -= debit
+        totals[key] = total
+    return totals
 
 
 def summarize_income(
     transactions_root: Path,
     accounts: Optional[Iterable[str]] = None,
+    max_workers: Optional[int] = None,
 ) -> list[IncomeSummary]:
     account_filter = {name.strip() for name in accounts or [] if name.strip()}
-    totals: Dict[Tuple[str, str, str, str], Decimal] = defaultdict(lambda: Decimal("0"))
-    for path in sorted(transactions_root.rglob("transactions_normalized.csv")):
-        account_name = path.parent.name
-        if account_filter and account_name not in account_filter:
-            continue
-        transactions = list(read_normalized_transactions(path))
-        for record in _income_records_from_transactions(transactions):
-            if account_filter and record.account_name not in account_filter:
-                continue
-            month = _month_key(record.trade_date)
-            symbol = record.symbol or "CASH"
-            description = record.description or "unknown"
-            account_name = record.account_name or "unknown"
-            totals[(account_name, month, symbol, description)] += _amount(record)
+    # normalize_transactions writes each account's records to
+    # <account>/transactions_normalized.csv, so filtering on the directory
+    # name covers every record in the file.
+    paths = [
+        path
+        for path in find_files(transactions_root, "transactions_normalized.csv")
+        if not account_filter or path.parent.name in account_filter
+    ]
+    totals: Dict[Tuple[str, Optional[int], str, str], Decimal] = {}
+    # Each file's cost basis and totals are independent, so files are
+    # summarized in parallel and merged here.
+    for file_totals in parallel_map(_income_totals, paths, max_workers=max_workers):
+        for key, total in file_totals.items():
+            totals[key] = totals.get(key, ZERO) + total
 
     summary = [
         IncomeSummary(
             account_name=account_name,
-            month=month,
+            month=_format_month(month),
             symbol=symbol,
             description=description,
             total_amount=total,
@@ -141,7 +163,6 @@ def write_income_report(rows: Iterable[IncomeSummary], output_path: Path) -> Non
     if not rows_list:
         return
     with output_path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=list(rows_list[0].to_dict().keys()))
-        writer.writeheader()
-        for row in rows_list:
-            writer.writerow(row.to_dict())
+        writer = csv.writer(handle)
+        writer.writerow(INCOME_SUMMARY_FIELDS)
+        writer.writerows(row.to_row() for row in rows_list)
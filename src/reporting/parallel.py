@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def parallel_map(fn: Callable[..., T], *iterables: Iterable, max_workers: Optional[int] = None) -> Iterator[T]:
+    """Like map, but spread across worker processes; results keep input order.
+
+    The pool never has more workers than tasks, and a single task or worker
+    runs inline so small reports skip process start-up entirely.
+    """
+    arguments = [list(iterable) for iterable in iterables]
+    task_count = min((len(values) for values in arguments), default=0)
+    workers = min(max_workers or os.cpu_count() or 1, task_count)
+    if workers <= 1:
+        yield from map(fn, *arguments)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(fn, *arguments)
@@ -4,21 +4,37 @@ import csv
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, Optional, Tuple
 
+from src.ingestion.files import find_files
 from src.ingestion.normalized import read_normalized_holdings, read_normalized_transactions
 from src.normalization.holdings import HoldingRecord
 from src.normalization.transactions import TransactionRecord
+from src.positions.transaction_utils import EMPTY_POSITION, ZERO, PositionCost
+from src.reporting.parallel import parallel_map
 
 
-@dataclass(frozen=True)
-class PositionCost:
-    quantity: Decimal
-    book_cost: Decimal
+# Only trades move quantity and book cost.
+POSITION_DESCRIPTIONS = {"buy", "sell"}
+
+UNREALIZED_GAIN_FIELDS = (
+    "account_name",
+    "valuation_date",
+    "symbol",
+    "name",
+    "quantity",
+    "price",
+    "book_cost",
+    "market_value",
+    "unrealized_gain",
+    "unrealized_gain_pct",
+    "currency",
+)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UnrealizedGainRow:
     account_name: str
     valuation_date: date
@@ -32,22 +48,23 @@ class UnrealizedGainRow:
     unrealized_gain_pct: Optional[Decimal]
     currency: Optional[str]
 
+    def to_row(self) -> Tuple[str, ...]:
+        return (
+            self.account_name,
+            self.valuation_date.isoformat(),
+            self.symbol,
+            self.name or "",
+            str(self.quantity) if self.quantity is not None else "",
+            str(self.price) if self.price is not None else "",
+            str(self.book_cost),
+            str(self.market_value),
+            str(self.unrealized_gain),
+            str(self.unrealized_gain_pct) if self.unrealized_gain_pct is not None else "",
+            self.currency or "",
+        )
+
     def to_dict(self) -> Dict[str, str]:
-        return {
-            "account_name": self.account_name,
-            "valuation_date": self.valuation_date.isoformat(),
-            "symbol": self.symbol,
-            "name": self.name or "",
-            "quantity": f"{self.quantity}" if self.quantity is not None else "",
-            "price": f"{self.price}" if self.price is not None else "",
-            "book_cost": f"{self.book_cost}",
-            "market_value": f"{self.market_value}",
-            "unrealized_gain": f"{self.unrealized_gain}",
-            "unrealized_gain_pct": (
-                f"{self.unrealized_gain_pct}" if self.unrealized_gain_pct is not None else ""
-            ),
-            "currency": self.currency or "",
-        }
+        return dict(zip(UNREALIZED_GAIN_FIELDS, self.to_row()))
 
 
 def _effective_date(record: TransactionRecord) -> Optional[date]:
@@ -79,9 +96,9 @@ def _apply_transaction(record: TransactionRecord, positions: Dict[str, PositionC
     if signed_quantity is None or not record.symbol:
         return
     symbol = record.symbol
-    position = positions.get(symbol, PositionCost(quantity=Decimal("0"), book_cost=Decimal("0")))
+    position = positions.get(symbol, EMPTY_POSITION)
     if signed_quantity > 0:
-        value = _transaction_value(record, signed_quantity) or Decimal("0")
+        value = _transaction_value(record, signed_quantity) or ZERO
         positions[symbol] = PositionCost(
             quantity=position.quantity + signed_quantity,
             book_cost=position.book_cost + value,
@@ -92,80 +109,49 @@ def _apply_transaction(record: TransactionRecord, positions: Dict[str, PositionC
     if position.quantity == 0:
         positions[symbol] = PositionCost(quantity=position.quantity - sell_quantity, book_cost=position.book_cost)
         return
-    average_cost = position.book_cost / position.quantity if position.quantity != 0 else Decimal("0")
+    average_cost = position.book_cost / position.quantity if position.quantity != 0 else ZERO
     positions[symbol] = PositionCost(
         quantity=position.quantity - sell_quantity,
         book_cost=position.book_cost - (average_cost * sell_quantity),
     )
 
 
-def _book_costs_by_date(
-    transactions: Iterable[TransactionRecord],
-    valuation_dates: Iterable[date],
-) -> Dict[date, Dict[str, PositionCost]]:
-    sorted_dates = sorted(set(valuation_dates))
-    sorted_transactions = sorted(
-        [record for record in transactions if _effective_date(record)],
-        key=lambda record: _effective_date(record),
-    )
-    positions: Dict[str, PositionCost] = {}
-    results: Dict[date, Dict[str, PositionCost]] = {}
-    index = 0
-
-    for valuation_date in sorted_dates:
-        while index < len(sorted_transactions):
-            record = sorted_transactions[index]
-            effective_date = _effective_date(record)
-            if effective_date is None or effective_date > valuation_date:
-                break
-            _apply_transaction(record, positions)
-            index += 1
-        results[valuation_date] = {symbol: PositionCost(pos.quantity, pos.book_cost) for symbol, pos in positions.items()}
-    return results
-
-
 def _market_value(holding: HoldingRecord) -> Decimal:
     if holding.market_value is not None:
         return holding.market_value
     if holding.quantity is not None and holding.price is not None:
         return holding.quantity * holding.price
-    return Decimal("0")
+    return ZERO
 
 
-def summarize_unrealized_gains(
-    transactions_root: Path,
-    holdings_root: Path,
-    accounts: Optional[Iterable[str]] = None,
+def _unrealized_gain_rows(
+    account_name: str,
+    transactions: Iterable[TransactionRecord],
+    holdings: Iterable[HoldingRecord],
 ) -> list[UnrealizedGainRow]:
-    account_filter = {name.strip() for name in accounts or [] if name.strip()}
-
-    transactions_by_account: Dict[str, list[TransactionRecord]] = {}
-    for path in sorted(transactions_root.rglob("transactions_normalized.csv")):
-        account_name = path.parent.name
-        if account_filter and account_name not in account_filter:
-            continue
-        transactions_by_account[account_name] = list(read_normalized_transactions(path))
-
-    holdings_by_account: Dict[str, list[HoldingRecord]] = {}
-    valuation_dates_by_account: Dict[str, set[date]] = {}
+    holdings_by_date: Dict[date, list[HoldingRecord]] = {}
+    for holding in holdings:
+        holdings_by_date.setdefault(holding.valuation_date, []).append(holding)
+    dated_transactions = [
+        (effective_date, record)
+        for record in transactions
+        if (effective_date := _effective_date(record))
+    ]
+    dated_transactions.sort(key=itemgetter(0))
+    remaining = iter(dated_transactions)
+    positions: Dict[str, PositionCost] = {}
+    pending = next(remaining, None)
+    rows: list[UnrealizedGainRow] = []
 
-    for path in sorted(holdings_root.rglob("holdings_*_normalized.csv")):
-        for holding in read_normalized_holdings(path):
-            account_name = holding.account_name or path.parent.name
-            if account_filter and account_name not in account_filter:
-                continue
-            holdings_by_account.setdefault(account_name, []).append(holding)
-            valuation_dates_by_account.setdefault(account_name, set()).add(holding.valuation_date)
+    # Walk the trades once, pricing each date's holdings against the live
+    # positions as soon as the cursor reaches that date; no per-date copies.
+    for valuation_date in sorted(holdings_by_date):
+        while pending is not None and pending[0] <= valuation_date:
+            _apply_transaction(pending[1], positions)
+            pending = next(remaining, None)
 
-    rows: list[UnrealizedGainRow] = []
-    for account_name, holdings in holdings_by_account.items():
-        transactions = transactions_by_account.get(account_name, [])
-        valuation_dates = valuation_dates_by_account.get(account_name, set())
-        book_costs_by_date = _book_costs_by_date(transactions, valuation_dates)
-
-        for holding in holdings:
-            positions = book_costs_by_date.get(holding.valuation_date, {})
-            position = positions.get(holding.symbol, PositionCost(quantity=Decimal("0"), book_cost=Decimal("0")))
+        for holding in holdings_by_date[valuation_date]:
+            position = positions.get(holding.symbol, EMPTY_POSITION)
             market_value = _market_value(holding)
             book_cost = position.book_cost
             unrealized_gain = market_value - book_cost
@@ -187,6 +173,58 @@ def summarize_unrealized_gains(
                     currency=holding.currency,
                 )
             )
+    return rows
+
+
+def _account_unrealized_gain_rows(
+    account_name: str,
+    transactions_path: Optional[Path],
+    holdings: list[HoldingRecord],
+) -> list[UnrealizedGainRow]:
+    transactions: Iterable[TransactionRecord] = (
+        read_normalized_transactions(transactions_path, POSITION_DESCRIPTIONS) if transactions_path else ()
+    )
+    return _unrealized_gain_rows(account_name, transactions, holdings)
+
+
+def summarize_unrealized_gains(
+    transactions_root: Path,
+    holdings_root: Path,
+    accounts: Optional[Iterable[str]] = None,
+    max_workers: Optional[int] = None,
+) -> list[UnrealizedGainRow]:
+    account_filter = {name.strip() for name in accounts or [] if name.strip()}
+
+    # Transactions are read one account at a time below, so only a single
+    # account's history is held in memory at once.
+    transaction_paths: Dict[str, Path] = {}
+    for path in find_files(transactions_root, "transactions_normalized.csv"):
+        account_name = path.parent.name
+        if account_filter and account_name not in account_filter:
+            continue
+        transaction_paths[account_name] = path
+
+    holdings_by_account: Dict[str, list[HoldingRecord]] = {}
+    for path in find_files(holdings_root, "holdings_*_normalized.csv"):
+        for holding in read_normalized_holdings(path):
+            account_name = holding.account_name or path.parent.name
+            if account_filter and account_name not in account_filter:
+                continue
+            holdings_by_account.setdefault(account_name, []).append(holding)
+
+    rows: list[UnrealizedGainRow] = []
+    # Accounts share no positions, so each one is priced in its own worker;
+    # transactions are read inside the worker rather than pickled across.
+    account_names = list(holdings_by_account)
+    account_rows = parallel_map(
+        _account_unrealized_gain_rows,
+        account_names,
+        [transaction_paths.get(account_name) for account_name in account_names],
+        [holdings_by_account[account_name] for account_name in account_names],
+        max_workers=max_workers,
+    )
+    for rows_for_account in account_rows:
+        rows.extend(rows_for_account)
 
     rows.sort(key=lambda row: (row.account_name, row.valuation_date, row.symbol))
     return rows
@@ -205,22 +243,22 @@ def write_unrealized_gain_reports(rows: Iterable[UnrealizedGainRow], output_root
         )
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with output_path.open("w", encoding="utf-8", newline="") as handle:
-            writer = csv.DictWriter(handle, fieldnames=list(grouped_rows[0].to_dict().keys()))
-            writer.writeheader()
-            for row in grouped_rows:
-                writer.writerow(row.to_dict())
+            writer = csv.writer(handle)
+            writer.writerow(UNREALIZED_GAIN_FIELDS)
+            writer.writerows(row.to_row() for row in grouped_rows)
 
 
 def _latest_rows_by_account(rows: Iterable[UnrealizedGainRow]) -> list[UnrealizedGainRow]:
-    rows_list = list(rows)
-    latest_by_account: Dict[str, date] = {}
-    for row in rows_list:
+    # One pass: each account keeps the rows for the newest date seen so far,
+    # and a newer date replaces the bucket.
+    latest_by_account: Dict[str, Tuple[date, list[UnrealizedGainRow]]] = {}
+    for row in rows:
         current = latest_by_account.get(row.account_name)
-        if current is None or row.valuation_date > current:
-            latest_by_account[row.account_name] = row.valuation_date
-    latest_rows = [
-        row for row in rows_list if row.valuation_date == latest_by_account.get(row.account_name)
-    ]
+        if current is None or row.valuation_date > current[0]:
+            latest_by_account[row.account_name] = (row.valuation_date, [row])
+        elif row.valuation_date == current[0]:
+            current[1].append(row)
+    latest_rows = [row for _, account_rows in latest_by_account.values() for row in account_rows]
     latest_rows.sort(key=lambda row: (row.account_name, row.valuation_date, row.symbol))
     return latest_rows
 
@@ -236,7 +274,6 @@ def write_combined_unrealized_gain_report(
         return
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with output_path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=list(rows_list[0].to_dict().keys()))
-        writer.writeheader()
-        for row in rows_list:
-            writer.writerow(row.to_dict())
+        writer = csv.writer(handle)
+        writer.writerow(UNREALIZED_GAIN_FIELDS)
+        writer.writerows(row.to_row() for row in rows_list)